@@ -1,12 +1,27 @@
 from neo4j.exceptions import ClientError as CypherError
+from pytest import raises
 
-from neomodel import StringProperty, StructuredNode
+from neomodel import RelationshipTo, StringProperty, StructuredNode, StructuredRel, db
 
 
 class User2(StructuredNode):
     email = StringProperty()
 
 
+class Follows3(StructuredRel):
+    pass
+
+
+class Blocks3(StructuredRel):
+    pass
+
+
+class User3(StructuredNode):
+    email = StringProperty()
+    follows = RelationshipTo("User3", "FOLLOWS_USER3", model=Follows3)
+    blocks = RelationshipTo("User3", "BLOCKS_USER3", model=Blocks3)
+
+
 def test_cypher():
     """
     test result format is backward compatible with earlier versions of neomodel
@@ -32,3 +47,120 @@ def test_cypher_syntax_error():
         assert hasattr(e, "code")
     else:
         assert False, "CypherError not raised."
+
+
+def test_cypher_query_stream():
+    jim = User2(email="jim2@test.com").save()
+    rows = list(
+        db.cypher_query_stream(
+            "MATCH (a:User2) WHERE id(a)=$id RETURN a, a.email",
+            {"id": jim.id},
+            resolve_objects=True,
+        )
+    )
+    assert len(rows) == 1
+    row, meta = rows[0]
+    assert isinstance(row[0], User2)
+    assert row[1] == "jim2@test.com"
+    assert list(meta) == ["a", "a.email"]
+
+
+def test_cypher_query_batch():
+    emails = ["batch{}@test.com".format(i) for i in range(5)]
+    for email in emails:
+        User2(email=email).save()
+
+    results = db.cypher_query_batch(
+        "UNWIND $ids AS id MATCH (a:User2 {email: id}) RETURN id, a",
+        emails,
+        batch_size=2,
+        resolve_objects=True,
+    )
+    assert sorted(results) == emails
+    for email, (key, user) in results.items():
+        assert key == email
+        assert isinstance(user, User2)
+        assert user.email == email
+
+
+def test_cypher_query_columnar():
+    emails = ["columnar{}@test.com".format(i) for i in range(3)]
+    for email in emails:
+        User2(email=email).save()
+
+    columns = db.cypher_query_columnar(
+        "MATCH (a:User2) WHERE a.email IN $emails "
+        "RETURN a, a.email AS email ORDER BY email",
+        {"emails": emails},
+        resolve_objects=True,
+    )
+    assert list(columns) == ["a", "email"]
+    assert columns["email"] == emails
+    assert [user.email for user in columns["a"]] == emails
+
+    columns = db.cypher_query_columnar("MATCH (a:User2) WHERE false RETURN a")
+    assert columns == {"a": []}
+
+
+def test_pooled_session():
+    User2(email="pooled@test.com").save()
+
+    with db.pooled_session(access_mode="READ") as session:
+        assert db._pooled_session.get() is session
+        for _ in range(3):
+            data, _ = db.cypher_query(
+                "MATCH (a:User2 {email: $email}) RETURN a.email",
+                {"email": "pooled@test.com"},
+            )
+            assert data[0][0] == "pooled@test.com"
+
+    assert db._pooled_session.get() is None
+
+
+def test_cypher_query_batch_rejects_ids_param():
+    with raises(ValueError):
+        db.cypher_query_batch(
+            "UNWIND $ids AS id RETURN id", ["a"], params={"ids": ["b"]}
+        )
+
+
+def test_cypher_query_batch_rejects_duplicate_keys():
+    with raises(ValueError):
+        db.cypher_query_batch(
+            "UNWIND $ids AS id UNWIND [1, 2] AS n RETURN id, n", ["a"]
+        )
+
+
+def test_resolve_objects_unlike_first_row():
+    """
+    Nodes and relationships are resolved in a column whose first row holds
+    a primitive value
+    """
+    alice = User3(email="alice3@test.com").save()
+    bob = User3(email="bob3@test.com").save()
+    alice.follows.connect(bob)
+
+    results, _ = db.cypher_query(
+        "MATCH (:User3 {email: 'alice3@test.com'})-[r:FOLLOWS_USER3]->(b:User3) "
+        "UNWIND [[null, 1], [b, r]] AS row "
+        "RETURN row[0], row[1]",
+        resolve_objects=True,
+    )
+    assert results[0] == [None, 1]
+    assert isinstance(results[1][0], User3)
+    assert results[1][0].email == "bob3@test.com"
+    assert isinstance(results[1][1], Follows3)
+
+
+def test_resolve_objects_mixed_relationship_types():
+    carol = User3(email="carol3@test.com").save()
+    dave = User3(email="dave3@test.com").save()
+    carol.blocks.connect(dave)
+    carol.follows.connect(dave)
+
+    results, _ = db.cypher_query(
+        "MATCH (:User3 {email: 'carol3@test.com'})-[r]->(:User3) "
+        "RETURN r ORDER BY type(r)",
+        resolve_objects=True,
+    )
+    assert [type(row[0]) for row in results] == [Blocks3, Follows3]
@@ -1,5 +1,8 @@
+import os
 from multiprocessing.pool import ThreadPool as Pool
 
+import pytest
+
 from neomodel import StringProperty, StructuredNode, db
 
 
@@ -18,3 +21,37 @@ def test_concurrency():
         results = p.map(thing_create, range(50))
         for returned, sent in results:
             assert returned == sent
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="os.fork is not available")
+def test_driver_rebuilt_after_fork():
+    db.cypher_query("RETURN 1")
+    parent_driver = db.driver
+
+    read_end, write_end = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        # In the child, report the outcome through the pipe and never return
+        # into the test runner
+        status = b"0"
+        try:
+            discarded = db.driver is None
+            results, _ = db.cypher_query("RETURN 1")
+            if (
+                discarded
+                and db.driver is not None
+                and db.driver is not parent_driver
+                and results[0][0] == 1
+            ):
+                status = b"1"
+        finally:
+            os.write(write_end, status)
+            os._exit(0)
+
+    os.close(write_end)
+    with os.fdopen(read_end, "rb") as child_output:
+        status = child_output.read()
+    os.waitpid(pid, 0)
+
+    assert status == b"1"
+    assert db.driver is parent_driver
@@ -1,3 +1,5 @@
+from threading import Thread
+
 import pytest
 from pytest import raises
 
@@ -168,3 +170,18 @@ def test_query_inside_bookmark_transaction(skip_neo4j_before_330):
         assert len([p.name for p in APerson.nodes]) == 2
 
     assert isinstance(transaction.last_bookmark, str)
+
+
+def test_transaction_is_isolated_per_thread():
+    seen = []
+
+    def check_no_transaction():
+        seen.append(db._active_transaction.get())
+
+    with db.transaction:
+        thread = Thread(target=check_no_transaction)
+        thread.start()
+        thread.join()
+        assert db._active_transaction.get() is not None
+
+    assert seen == [None]
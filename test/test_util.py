@@ -0,0 +1,12 @@
+import inspect
+
+from neomodel.util import enumerate_traceback, traceback_frames
+
+
+def test_traceback_frames():
+    frame = inspect.currentframe()
+    frames = traceback_frames(frame)
+
+    assert frames == list(enumerate_traceback(frame))
+    assert frames[0] == (0, frame)
+    assert frames[-1][1].f_back is None